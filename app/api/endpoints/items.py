@@ -1,7 +1,12 @@
 """Item endpoints."""
 
-from typing import List
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import count
+from typing import Any, List, Optional, get_args
 from fastapi import APIRouter, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 
 from app.api.schemas.item import (
     ItemCreate,
@@ -12,9 +17,55 @@ from app.api.schemas.item import (
 
 router = APIRouter()
 
+_now = datetime.now
+
+# ItemResponse fields that cannot be null; null updates to them are skipped
+_NON_NULLABLE_FIELDS = frozenset(
+    field_name
+    for field_name, field in ItemResponse.model_fields.items()
+    if type(None) not in get_args(field.annotation)
+)
+
+
+@dataclass(slots=True)
+class ItemRecord:
+    """Stored item, mirroring the fields of ItemResponse."""
+    id: int
+    name: str
+    description: Optional[str]
+    price: float
+    is_available: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
 # In-memory storage for demo purposes
-items_db: dict[int, dict] = {}
-item_id_counter = 1
+items_db: dict[int, ItemRecord] = {}
+_next_item_id = count(1).__next__
+
+# Ascending item ids (all, and available only) so pages are plain slices
+_items_order: list[int] = []
+_items_available: list[int] = []
+
+
+def _discard_id(ids: list[int], item_id: int) -> None:
+    """Remove an id from a sorted id list if present."""
+    index = bisect_left(ids, item_id)
+    if index < len(ids) and ids[index] == item_id:
+        del ids[index]
+
+
+def _item_response(record: ItemRecord) -> dict[str, Any]:
+    """Build the ItemResponse payload for a stored record."""
+    return {
+        "name": record.name,
+        "description": record.description,
+        "price": record.price,
+        "is_available": record.is_available,
+        "id": record.id,
+        "created_at": record.created_at,
+        "updated_at": record.updated_at,
+    }
 
 
 @router.post(
@@ -23,7 +74,7 @@ item_id_counter = 1
     status_code=status.HTTP_201_CREATED,
     summary="Create a new item",
 )
-async def create_item(item: ItemCreate) -> ItemResponse:
+async def create_item(item: ItemCreate) -> ORJSONResponse:
     """
     Create a new item with the following information:
 
@@ -32,22 +83,23 @@ async def create_item(item: ItemCreate) -> ItemResponse:
     - **price**: Item price (must be greater than 0)
     - **is_available**: Availability status (default: true)
     """
-    global item_id_counter
-
-    from datetime import datetime
-    item_data = {
-        "id": item_id_counter,
-        "name": item.name,
-        "description": item.description,
-        "price": item.price,
-        "is_available": item.is_available,
-        "created_at": datetime.now(),
-        "updated_at": None,
-    }
-    items_db[item_id_counter] = item_data
-    item_id_counter += 1
+    item_id = _next_item_id()
+    item_data = ItemRecord(
+        id=item_id,
+        name=item.name,
+        description=item.description,
+        price=item.price,
+        is_available=item.is_available,
+        created_at=_now(),
+    )
+    items_db[item_id] = item_data
+    _items_order.append(item_id)
+    if item.is_available:
+        _items_available.append(item_id)
 
-    return ItemResponse(**item_data)
+    return ORJSONResponse(
+        _item_response(item_data), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get(
@@ -59,7 +111,7 @@ async def get_items(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
     available_only: bool = Query(False, description="Filter only available items"),
-) -> ItemList:
+) -> ORJSONResponse:
     """
     Retrieve a paginated list of all items.
 
@@ -67,24 +119,21 @@ async def get_items(
     - **page_size**: Number of items per page (default: 10, max: 100)
     - **available_only**: Filter to show only available items (default: false)
     """
-    all_items = list(items_db.values())
-
-    if available_only:
-        all_items = [item for item in all_items if item["is_available"]]
-
-    total = len(all_items)
+    item_ids = _items_available if available_only else _items_order
+    total = len(item_ids)
 
     # Calculate pagination
     start = (page - 1) * page_size
     end = start + page_size
-    paginated_items = all_items[start:end]
+    paginated_items = [items_db[item_id] for item_id in item_ids[start:end]]
 
-    return ItemList(
-        items=[ItemResponse(**item) for item in paginated_items],
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+    # Returning a response directly bypasses FastAPI's response validation
+    return ORJSONResponse({
+        "items": [_item_response(item) for item in paginated_items],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+    })
 
 
 @router.get(
@@ -92,19 +141,20 @@ async def get_items(
     response_model=ItemResponse,
     summary="Get item by ID",
 )
-async def get_item(item_id: int) -> ItemResponse:
+async def get_item(item_id: int) -> ORJSONResponse:
     """
     Get a specific item by ID.
 
     - **item_id**: The ID of the item to retrieve
     """
-    if item_id not in items_db:
+    item_data = items_db.get(item_id)
+    if item_data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item with id {item_id} not found"
         )
 
-    return ItemResponse(**items_db[item_id])
+    return ORJSONResponse(_item_response(item_data))
 
 
 @router.put(
@@ -112,7 +162,7 @@ async def get_item(item_id: int) -> ItemResponse:
     response_model=ItemResponse,
     summary="Update item",
 )
-async def update_item(item_id: int, item_update: ItemUpdate) -> ItemResponse:
+async def update_item(item_id: int, item_update: ItemUpdate) -> ORJSONResponse:
     """
     Update an item's information.
 
@@ -122,20 +172,28 @@ async def update_item(item_id: int, item_update: ItemUpdate) -> ItemResponse:
     - **price**: New price (optional)
     - **is_available**: New availability status (optional)
     """
-    if item_id not in items_db:
+    item_data = items_db.get(item_id)
+    if item_data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item with id {item_id} not found"
         )
 
-    item_data = items_db[item_id]
-    update_data = item_update.model_dump(exclude_unset=True)
+    was_available = item_data.is_available
+    for field in item_update.__pydantic_fields_set__:
+        value = getattr(item_update, field)
+        if value is None and field in _NON_NULLABLE_FIELDS:
+            continue
+        setattr(item_data, field, value)
+    item_data.updated_at = _now()
 
-    from datetime import datetime
-    item_data.update(update_data)
-    item_data["updated_at"] = datetime.now()
+    if item_data.is_available != was_available:
+        if was_available:
+            _discard_id(_items_available, item_id)
+        else:
+            insort(_items_available, item_id)
 
-    return ItemResponse(**item_data)
+    return ORJSONResponse(_item_response(item_data))
 
 
 @router.delete(
@@ -149,11 +207,14 @@ async def delete_item(item_id: int):
 
     - **item_id**: The ID of the item to delete
     """
-    if item_id not in items_db:
+    item_data = items_db.pop(item_id, None)
+    if item_data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item with id {item_id} not found"
         )
 
-    del items_db[item_id]
+    _discard_id(_items_order, item_id)
+    if item_data.is_available:
+        _discard_id(_items_available, item_id)
     return None
@@ -1,7 +1,12 @@
 """User endpoints."""
 
-from typing import List
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import count
+from typing import Any, List, Optional, get_args
 from fastapi import APIRouter, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 
 from app.api.schemas.user import (
     UserCreate,
@@ -12,9 +17,51 @@ from app.api.schemas.user import (
 
 router = APIRouter()
 
+_now = datetime.now
+
+# UserResponse fields that cannot be null; null updates to them are skipped
+_NON_NULLABLE_FIELDS = frozenset(
+    field_name
+    for field_name, field in UserResponse.model_fields.items()
+    if type(None) not in get_args(field.annotation)
+)
+
+
+@dataclass(slots=True)
+class UserRecord:
+    """Stored user, mirroring the fields of UserResponse."""
+    id: int
+    email: str
+    username: str
+    full_name: Optional[str]
+    is_active: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
 # In-memory storage for demo purposes
-users_db: dict[int, dict] = {}
-user_id_counter = 1
+users_db: dict[int, UserRecord] = {}
+_next_user_id = count(1).__next__
+
+# Ascending user ids so pages are plain slices
+_users_order: list[int] = []
+
+# Username/email -> user id, kept in sync with users_db for uniqueness checks
+_usernames_index: dict[str, int] = {}
+_emails_index: dict[str, int] = {}
+
+
+def _user_response(record: UserRecord) -> dict[str, Any]:
+    """Build the UserResponse payload for a stored record."""
+    return {
+        "email": record.email,
+        "username": record.username,
+        "full_name": record.full_name,
+        "id": record.id,
+        "is_active": record.is_active,
+        "created_at": record.created_at,
+        "updated_at": record.updated_at,
+    }
 
 
 @router.post(
@@ -23,7 +70,7 @@ user_id_counter = 1
     status_code=status.HTTP_201_CREATED,
     summary="Create a new user",
 )
-async def create_user(user: UserCreate) -> UserResponse:
+async def create_user(user: UserCreate) -> ORJSONResponse:
     """
     Create a new user with the following information:
 
@@ -32,35 +79,35 @@ async def create_user(user: UserCreate) -> UserResponse:
     - **full_name**: Optional full name
     - **password**: Password (8-100 characters)
     """
-    global user_id_counter
-
-    # Check if username already exists
-    for existing_user in users_db.values():
-        if existing_user["username"] == user.username:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already exists"
-            )
-        if existing_user["email"] == user.email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already exists"
-            )
+    # Check if username or email already exists
+    if user.username in _usernames_index:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username already exists"
+        )
+    if user.email in _emails_index:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already exists"
+        )
 
-    from datetime import datetime
-    user_data = {
-        "id": user_id_counter,
-        "email": user.email,
-        "username": user.username,
-        "full_name": user.full_name,
-        "is_active": True,
-        "created_at": datetime.now(),
-        "updated_at": None,
-    }
-    users_db[user_id_counter] = user_data
-    user_id_counter += 1
+    user_id = _next_user_id()
+    user_data = UserRecord(
+        id=user_id,
+        email=user.email,
+        username=user.username,
+        full_name=user.full_name,
+        is_active=True,
+        created_at=_now(),
+    )
+    users_db[user_id] = user_data
+    _usernames_index[user.username] = user_id
+    _emails_index[user.email] = user_id
+    _users_order.append(user_id)
 
-    return UserResponse(**user_data)
+    return ORJSONResponse(
+        _user_response(user_data), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get(
@@ -71,27 +118,27 @@ async def create_user(user: UserCreate) -> UserResponse:
 async def get_users(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
-) -> UserList:
+) -> ORJSONResponse:
     """
     Retrieve a paginated list of all users.
 
     - **page**: Page number (default: 1)
     - **page_size**: Number of items per page (default: 10, max: 100)
     """
-    all_users = list(users_db.values())
-    total = len(all_users)
+    total = len(_users_order)
 
     # Calculate pagination
     start = (page - 1) * page_size
     end = start + page_size
-    paginated_users = all_users[start:end]
+    paginated_users = [users_db[user_id] for user_id in _users_order[start:end]]
 
-    return UserList(
-        users=[UserResponse(**user) for user in paginated_users],
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+    # Returning a response directly bypasses FastAPI's response validation
+    return ORJSONResponse({
+        "users": [_user_response(user) for user in paginated_users],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+    })
 
 
 @router.get(
@@ -99,19 +146,20 @@ async def get_users(
     response_model=UserResponse,
     summary="Get user by ID",
 )
-async def get_user(user_id: int) -> UserResponse:
+async def get_user(user_id: int) -> ORJSONResponse:
     """
     Get a specific user by ID.
 
     - **user_id**: The ID of the user to retrieve
     """
-    if user_id not in users_db:
+    user_data = users_db.get(user_id)
+    if user_data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with id {user_id} not found"
         )
 
-    return UserResponse(**users_db[user_id])
+    return ORJSONResponse(_user_response(user_data))
 
 
 @router.put(
@@ -119,7 +167,7 @@ async def get_user(user_id: int) -> UserResponse:
     response_model=UserResponse,
     summary="Update user",
 )
-async def update_user(user_id: int, user_update: UserUpdate) -> UserResponse:
+async def update_user(user_id: int, user_update: UserUpdate) -> ORJSONResponse:
     """
     Update a user's information.
 
@@ -128,20 +176,33 @@ async def update_user(user_id: int, user_update: UserUpdate) -> UserResponse:
     - **full_name**: New full name (optional)
     - **password**: New password (optional)
     """
-    if user_id not in users_db:
+    user_data = users_db.get(user_id)
+    if user_data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with id {user_id} not found"
         )
 
-    user_data = users_db[user_id]
-    update_data = user_update.model_dump(exclude_unset=True)
+    new_email = user_update.email
+    if new_email is not None and new_email != user_data.email:
+        if new_email in _emails_index:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already exists"
+            )
+        del _emails_index[user_data.email]
+        _emails_index[new_email] = user_id
 
-    from datetime import datetime
-    user_data.update(update_data)
-    user_data["updated_at"] = datetime.now()
+    for field in user_update.__pydantic_fields_set__:
+        if field == "password":
+            continue
+        value = getattr(user_update, field)
+        if value is None and field in _NON_NULLABLE_FIELDS:
+            continue
+        setattr(user_data, field, value)
+    user_data.updated_at = _now()
 
-    return UserResponse(**user_data)
+    return ORJSONResponse(_user_response(user_data))
 
 
 @router.delete(
@@ -155,11 +216,14 @@ async def delete_user(user_id: int):
 
     - **user_id**: The ID of the user to delete
     """
-    if user_id not in users_db:
+    user_data = users_db.pop(user_id, None)
+    if user_data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with id {user_id} not found"
         )
 
-    del users_db[user_id]
+    del _users_order[bisect_left(_users_order, user_id)]
+    _usernames_index.pop(user_data.username, None)
+    _emails_index.pop(user_data.email, None)
     return None
@@ -32,7 +32,7 @@ class ItemResponse(ItemBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ItemList(BaseModel):
@@ -41,3 +41,5 @@ class ItemList(BaseModel):
     total: int
     page: int
     page_size: int
+
+    model_config = ConfigDict(frozen=True)
@@ -31,7 +31,7 @@ class UserResponse(UserBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class UserList(BaseModel):
@@ -40,3 +40,5 @@ class UserList(BaseModel):
     total: int
     page: int
     page_size: int
+
+    model_config = ConfigDict(frozen=True)
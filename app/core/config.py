@@ -1,5 +1,6 @@
 """Application configuration settings."""
 
+from functools import lru_cache
 from typing import List
 from pydantic_settings import BaseSettings
 
@@ -36,4 +37,10 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Return the application settings, loaded once per process."""
+    return Settings()
+
+
+settings = get_settings()
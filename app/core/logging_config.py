@@ -0,0 +1,36 @@
+"""Application logging configuration."""
+
+import logging
+import logging.handlers
+
+from app.core.config import settings
+
+# Records are buffered and written in batches; errors are written immediately
+BUFFER_CAPACITY = 100
+
+
+def setup_logging() -> logging.Logger:
+    """Configure and return the application logger."""
+    logger = logging.getLogger("app")
+    if logger.handlers:
+        return logger
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    logger.addHandler(
+        logging.handlers.MemoryHandler(
+            BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=stream_handler,
+        )
+    )
+    logger.setLevel(settings.LOG_LEVEL.upper())
+    return logger
+
+
+def flush_logging() -> None:
+    """Write out any buffered application log records."""
+    for handler in logging.getLogger("app").handlers:
+        handler.flush()
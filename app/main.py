@@ -1,13 +1,31 @@
 """Main FastAPI application module."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.api.endpoints import health, items, users
 from app.core.config import settings
+from app.core.logging_config import flush_logging, setup_logging
 from app.middleware.error_handler import add_error_handlers
 
+logger = setup_logging()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run on application startup and shutdown."""
+    logger.info("Starting %s v%s", settings.PROJECT_NAME, settings.VERSION)
+    logger.info("Environment: %s", settings.ENVIRONMENT)
+    logger.info("Debug mode: %s", settings.DEBUG)
+    flush_logging()
+    yield
+    logger.info("Shutting down application...")
+    flush_logging()
+
 
 def create_application() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -18,6 +36,8 @@ def create_application() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
     # Set up CORS
@@ -41,17 +61,3 @@ def create_application() -> FastAPI:
 
 
 app = create_application()
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup."""
-    print(f"Starting {settings.PROJECT_NAME} v{settings.VERSION}")
-    print(f"Environment: {settings.ENVIRONMENT}")
-    print(f"Debug mode: {settings.DEBUG}")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown."""
-    print("Shutting down application...")
@@ -1,10 +1,17 @@
 """Error handling middleware."""
 
-from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 
+# Outside debug mode the 500 body never varies, so it is encoded once
+_INTERNAL_ERROR_BODY = orjson.dumps({
+    "detail": "Internal server error",
+    "message": "An unexpected error occurred",
+})
+
 
 def add_error_handlers(app: FastAPI) -> None:
     """Add custom error handlers to the FastAPI application."""
@@ -12,17 +19,18 @@ def add_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(
         request: Request, exc: RequestValidationError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle validation errors."""
-        errors = []
-        for error in exc.errors():
-            errors.append({
-                "field": " -> ".join(str(loc) for loc in error["loc"]),
+        errors = [
+            {
+                "field": " -> ".join(map(str, error["loc"])),
                 "message": error["msg"],
                 "type": error["type"],
-            })
+            }
+            for error in exc.errors()
+        ]
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
                 "detail": "Validation error",
@@ -31,9 +39,9 @@ def add_error_handlers(app: FastAPI) -> None:
         )
 
     @app.exception_handler(ValueError)
-    async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
+    async def value_error_handler(request: Request, exc: ValueError) -> ORJSONResponse:
         """Handle value errors."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={
                 "detail": str(exc),
@@ -43,12 +51,18 @@ def add_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def general_exception_handler(
         request: Request, exc: Exception
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle general exceptions."""
-        return JSONResponse(
+        if not app.debug:
+            return Response(
+                content=_INTERNAL_ERROR_BODY,
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                media_type="application/json",
+            )
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "detail": "Internal server error",
-                "message": str(exc) if app.debug else "An unexpected error occurred",
+                "message": str(exc),
             },
         )
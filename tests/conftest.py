@@ -1,5 +1,7 @@
 """Pytest configuration and fixtures."""
 
+import itertools
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -18,13 +20,23 @@ def reset_data():
     from app.api.endpoints import users, items
 
     users.users_db.clear()
-    users.user_id_counter = 1
+    users._next_user_id = itertools.count(1).__next__
+    users._usernames_index.clear()
+    users._emails_index.clear()
+    users._users_order.clear()
     items.items_db.clear()
-    items.item_id_counter = 1
+    items._next_item_id = itertools.count(1).__next__
+    items._items_order.clear()
+    items._items_available.clear()
 
     yield
 
     users.users_db.clear()
-    users.user_id_counter = 1
+    users._next_user_id = itertools.count(1).__next__
+    users._usernames_index.clear()
+    users._emails_index.clear()
+    users._users_order.clear()
     items.items_db.clear()
-    items.item_id_counter = 1
+    items._next_item_id = itertools.count(1).__next__
+    items._items_order.clear()
+    items._items_available.clear()
@@ -0,0 +1,26 @@
+"""Tests for error handling middleware."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.error_handler import add_error_handlers
+
+
+def test_general_exception_returns_cached_body():
+    """Test unhandled errors return the fixed 500 body outside debug mode."""
+    app = FastAPI()
+    add_error_handlers(app)
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("secret details")
+
+    client = TestClient(app, raise_server_exceptions=False)
+    response = client.get("/boom")
+
+    assert response.status_code == 500
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == (
+        b'{"detail":"Internal server error",'
+        b'"message":"An unexpected error occurred"}'
+    )
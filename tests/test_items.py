@@ -3,6 +3,8 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api.schemas.item import ItemList, ItemResponse
+
 
 def test_create_item(client: TestClient):
     """Test creating a new item."""
@@ -90,6 +92,46 @@ def test_get_items_available_only(client: TestClient):
     assert data["items"][0]["name"] == "Available Item"
 
 
+def test_get_items_available_only_after_changes(client: TestClient):
+    """Test availability filter reflects updates and deletions."""
+    for i in range(3):
+        client.post("/api/items/", json={
+            "name": f"Item {i}",
+            "price": 10.0 + i,
+            "is_available": i != 1
+        })
+
+    client.put("/api/items/1", json={"is_available": False})
+    client.put("/api/items/2", json={"is_available": True})
+    client.delete("/api/items/3")
+
+    response = client.get("/api/items/?available_only=true")
+    data = response.json()
+    assert data["total"] == 1
+    assert [item["id"] for item in data["items"]] == [2]
+
+    response = client.get("/api/items/")
+    data = response.json()
+    assert data["total"] == 2
+    assert [item["id"] for item in data["items"]] == [1, 2]
+
+
+def test_get_items_available_only_null_update(client: TestClient):
+    """Test a null availability update does not list an unavailable item."""
+    client.post("/api/items/", json={
+        "name": "Unavailable Item",
+        "price": 20.0,
+        "is_available": False
+    })
+
+    client.put("/api/items/1", json={"is_available": None})
+
+    response = client.get("/api/items/?available_only=true")
+    data = response.json()
+    assert data["total"] == 0
+    assert data["items"] == []
+
+
 def test_get_items_pagination(client: TestClient):
     """Test item list pagination."""
     # Create 5 items
@@ -179,6 +221,46 @@ def test_update_item_partial(client: TestClient):
     assert data["description"] == "Original description"
 
 
+def test_update_item_null_fields(client: TestClient):
+    """Test null values keep required fields and clear optional ones."""
+    client.post("/api/items/", json={
+        "name": "Test Item",
+        "description": "A test item",
+        "price": 29.99
+    })
+
+    response = client.put("/api/items/1", json={
+        "name": None,
+        "description": None,
+        "price": None,
+        "is_available": None
+    })
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "Test Item"
+    assert data["description"] is None
+    assert data["price"] == 29.99
+    assert data["is_available"] is True
+
+
+def test_update_item_null_fields_match_schema(client: TestClient):
+    """Test bodies after a null update still satisfy the response schemas."""
+    client.post("/api/items/", json={"name": "Test Item", "price": 29.99})
+    null_update = {
+        "name": None,
+        "description": None,
+        "price": None,
+        "is_available": None
+    }
+
+    response = client.put("/api/items/1", json=null_update)
+    ItemResponse.model_validate(response.json())
+
+    ItemResponse.model_validate(client.get("/api/items/1").json())
+    ItemList.model_validate(client.get("/api/items/").json())
+
+
 def test_update_item_not_found(client: TestClient):
     """Test updating non-existent item returns 404."""
     response = client.put("/api/items/999", json={"price": 10.0})
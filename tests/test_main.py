@@ -0,0 +1,29 @@
+"""Tests for application lifespan and logging."""
+
+import io
+import logging
+import logging.handlers
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def test_lifespan_flushes_startup_and_shutdown_logs():
+    """Test lifespan writes out buffered startup and shutdown records."""
+    handler = next(
+        h for h in logging.getLogger("app").handlers
+        if isinstance(h, logging.handlers.MemoryHandler)
+    )
+    stream = io.StringIO()
+    original_stream = handler.target.setStream(stream)
+
+    try:
+        with TestClient(app):
+            output = stream.getvalue()
+            assert "Starting FastAPI Web Application v0.1.0" in output
+            assert "Shutting down" not in output
+
+        assert "Shutting down application..." in stream.getvalue()
+    finally:
+        handler.target.setStream(original_stream)
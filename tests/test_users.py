@@ -3,6 +3,8 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api.schemas.user import UserList, UserResponse
+
 
 def test_create_user(client: TestClient):
     """Test creating a new user."""
@@ -119,6 +121,24 @@ def test_get_users_pagination(client: TestClient):
     assert data["page"] == 2
 
 
+def test_get_users_pagination_after_delete(client: TestClient):
+    """Test deleted users are skipped when paginating."""
+    for i in range(5):
+        client.post("/api/users/", json={
+            "email": f"test{i}@example.com",
+            "username": f"testuser{i}",
+            "password": "securepassword123"
+        })
+
+    client.delete("/api/users/2")
+
+    response = client.get("/api/users/?page=1&page_size=2")
+    data = response.json()
+
+    assert data["total"] == 4
+    assert [user["id"] for user in data["users"]] == [1, 3]
+
+
 def test_get_user_by_id(client: TestClient):
     """Test getting a specific user by ID."""
     # Create a user
@@ -166,6 +186,84 @@ def test_update_user(client: TestClient):
     assert data["updated_at"] is not None
 
 
+def test_update_user_password(client: TestClient):
+    """Test updating a user's password does not expose it."""
+    create_response = client.post("/api/users/", json={
+        "email": "test@example.com",
+        "username": "testuser",
+        "password": "securepassword123"
+    })
+    user_id = create_response.json()["id"]
+
+    response = client.put(f"/api/users/{user_id}", json={"password": "newpassword123"})
+
+    assert response.status_code == 200
+    assert "password" not in response.json()
+
+
+def test_update_user_duplicate_email(client: TestClient):
+    """Test updating a user to another user's email fails."""
+    client.post("/api/users/", json={
+        "email": "test1@example.com",
+        "username": "testuser1",
+        "password": "securepassword123"
+    })
+    create_response = client.post("/api/users/", json={
+        "email": "test2@example.com",
+        "username": "testuser2",
+        "password": "securepassword123"
+    })
+    user_id = create_response.json()["id"]
+
+    response = client.put(f"/api/users/{user_id}", json={"email": "test1@example.com"})
+
+    assert response.status_code == 400
+    assert "Email already exists" in response.json()["detail"]
+
+
+def test_update_user_null_email(client: TestClient):
+    """Test a null email leaves the user's email and index untouched."""
+    create_response = client.post("/api/users/", json={
+        "email": "test@example.com",
+        "username": "testuser",
+        "password": "securepassword123"
+    })
+    user_id = create_response.json()["id"]
+
+    response = client.put(f"/api/users/{user_id}", json={"email": None})
+
+    assert response.status_code == 200
+    assert response.json()["email"] == "test@example.com"
+
+    response = client.delete(f"/api/users/{user_id}")
+    assert response.status_code == 204
+
+    # The email is free again after deletion
+    response = client.post("/api/users/", json={
+        "email": "test@example.com",
+        "username": "otheruser",
+        "password": "securepassword123"
+    })
+    assert response.status_code == 201
+
+
+def test_update_user_null_fields_match_schema(client: TestClient):
+    """Test bodies after a null update still satisfy the response schemas."""
+    client.post("/api/users/", json={
+        "email": "test@example.com",
+        "username": "testuser",
+        "full_name": "Test User",
+        "password": "securepassword123"
+    })
+    null_update = {"email": None, "full_name": None, "password": None}
+
+    response = client.put("/api/users/1", json=null_update)
+    UserResponse.model_validate(response.json())
+
+    UserResponse.model_validate(client.get("/api/users/1").json())
+    UserList.model_validate(client.get("/api/users/").json())
+
+
 def test_update_user_not_found(client: TestClient):
     """Test updating non-existent user returns 404."""
     response = client.put("/api/users/999", json={"full_name": "Test"})
@@ -192,6 +290,14 @@ def test_delete_user(client: TestClient):
     get_response = client.get(f"/api/users/{user_id}")
     assert get_response.status_code == 404
 
+    # Username and email are free to reuse after deletion
+    recreate_response = client.post("/api/users/", json={
+        "email": "test@example.com",
+        "username": "testuser",
+        "password": "securepassword123"
+    })
+    assert recreate_response.status_code == 201
+
 
 def test_delete_user_not_found(client: TestClient):
     """Test deleting non-existent user returns 404."""